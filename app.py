@@ -5,7 +5,12 @@ AI Resume Generator - Clean and focused implementation
 
 import gradio as gr
 import os
+import re
 import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -14,27 +19,62 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from ai.resume_generator import AIResumeGenerator
 
+# Separates job descriptions in the multi-target textbox: a line containing only ---
+JOB_SEPARATOR = re.compile(r'^\s*-{3,}\s*$', re.MULTILINE)
+
+# Finished compiles nobody collected (e.g. the tab closed before wait_for_pdf ran) are dropped
+# after this many seconds
+ABANDONED_JOB_SECONDS = 600
+
 class ResumeApp:
-    def __init__(self):
-        self.api_key = os.getenv('GEMINI_API_KEY')
+    def __init__(self, api_key=None, model=None, compile_workers=None, batch_compile_workers=None):
+        self.api_key = api_key or os.getenv('GEMINI_API_KEY')
+        self.model = model
+        # Offline mode: local pre-parser only, no Gemini calls or API key needed
+        self.offline = os.getenv('RESUME_AI_OFFLINE', '').lower() in ('1', 'true', 'yes')
+        # Background pdflatex runs; job id -> (future, cancel event, session, start time).
+        # Multi-job batches get their own pool so a 20-JD batch never queues in front of
+        # interactive previews.
+        compile_workers = compile_workers or int(os.getenv('RESUME_COMPILE_WORKERS', '2'))
+        batch_compile_workers = batch_compile_workers or int(os.getenv('RESUME_BATCH_COMPILE_WORKERS', '2'))
+        self.compile_pool = ThreadPoolExecutor(max_workers=compile_workers)
+        self.batch_compile_pool = ThreadPoolExecutor(max_workers=batch_compile_workers)
+        self._jobs = {}
+        # Latest click per browser session; older clicks' results are dropped
+        self._sessions = {}
+        # Running multi-job batch per session -> cancel event
+        self._batches = {}
+        self._jobs_lock = threading.Lock()
         
+    def _build_raw_data(self, full_name, email, phone, location, linkedin, portfolio,
+                        summary, experience, education, projects, skills, certifications):
+        return {
+            "full_name": full_name, "email": email, "phone": phone, "location": location,
+            "linkedin": linkedin, "portfolio": portfolio, "summary": summary,
+            "experience": experience, "education": education, "projects": projects,
+            "skills": skills, "certifications": certifications
+        }
+    
+    def _create_generator(self):
+        return AIResumeGenerator(api_key=self.api_key, template_type="tech", model=self.model, offline=self.offline)
+    
+    def _output_name(self):
+        # Suffix keeps concurrent requests within the same second from sharing .tex/.pdf files
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"resume_{timestamp}_{uuid.uuid4().hex[:8]}"
+    
     def generate_resume(self, full_name, email, phone, location, linkedin, portfolio, 
                        summary, experience, education, projects, skills, certifications, job_description):
         try:
-            if not self.api_key:
+            if not self.api_key and self.model is None and not self.offline:
                 return None, "❌ Gemini API key not found in .env file"
             
-            generator = AIResumeGenerator(api_key=self.api_key, template_type="tech")
+            generator = self._create_generator()
             
-            raw_data = {
-                "full_name": full_name, "email": email, "phone": phone, "location": location,
-                "linkedin": linkedin, "portfolio": portfolio, "summary": summary,
-                "experience": experience, "education": education, "projects": projects,
-                "skills": skills, "certifications": certifications
-            }
+            raw_data = self._build_raw_data(full_name, email, phone, location, linkedin, portfolio,
+                                            summary, experience, education, projects, skills, certifications)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            pdf_path = generator.generate_resume(raw_data, job_description, f"resume_{timestamp}")
+            pdf_path = generator.generate_resume(raw_data, job_description, self._output_name())
             
             if pdf_path and os.path.exists(pdf_path):
                 return pdf_path, "✅ Resume generated successfully!"
@@ -43,6 +83,151 @@ class ResumeApp:
                 
         except Exception as e:
             return None, f"❌ Error: {str(e)}"
+    
+    def _session_key(self, request, token):
+        # Direct (non-Gradio) callers have no session: each call is its own
+        return getattr(request, "session_hash", None) or token
+    
+    def _start_generation(self, session, token):
+        """Make token the session's current generation and cancel whatever it superseded"""
+        with self._jobs_lock:
+            self._prune_abandoned_jobs()
+            previous = self._sessions.get(session)
+            self._sessions[session] = token
+            job = self._jobs.pop(previous, None) if previous else None
+        if job:
+            job[1].set()
+    
+    def _prune_abandoned_jobs(self):
+        # Caller holds _jobs_lock
+        cutoff = time.monotonic() - ABANDONED_JOB_SECONDS
+        for token, (future, _, session, started) in list(self._jobs.items()):
+            if future.done() and started < cutoff:
+                del self._jobs[token]
+                if self._sessions.get(session) == token:
+                    del self._sessions[session]
+    
+    def preview_resume(self, full_name, email, phone, location, linkedin, portfolio,
+                       summary, experience, education, projects, skills, certifications, job_description,
+                       request: gr.Request = None):
+        """Enhance, render the HTML preview and start the PDF compile in the background.
+
+        Returns (job_id, preview_html, pdf, status). The generation token is taken at click
+        time, so a newer click in the same session cancels this one's compile and this
+        call's outputs are dropped if it finishes after being superseded.
+        """
+        token = uuid.uuid4().hex
+        session = self._session_key(request, token)
+        self._start_generation(session, token)
+        unchanged = (gr.update(), gr.update(), gr.update(), gr.update())
+        registered = False
+        try:
+            if not self.api_key and self.model is None and not self.offline:
+                return None, "", None, "❌ Gemini API key not found in .env file"
+            
+            generator = self._create_generator()
+            
+            raw_data = self._build_raw_data(full_name, email, phone, location, linkedin, portfolio,
+                                            summary, experience, education, projects, skills, certifications)
+            
+            enhanced_data = generator.enhance_resume_with_ai(raw_data, job_description)
+            preview_html = generator.generate_html_preview(enhanced_data)
+            latex_content = generator.generate_latex_content(enhanced_data)
+            
+            cancel_event = threading.Event()
+            with self._jobs_lock:
+                if self._sessions.get(session) != token:
+                    return unchanged
+                future = self.compile_pool.submit(
+                    generator.compile_latex_to_pdf, latex_content, self._output_name(), cancel_event)
+                self._jobs[token] = (future, cancel_event, session, time.monotonic())
+                registered = True
+            
+            return token, preview_html, None, "⏳ Preview ready - compiling PDF..."
+            
+        except Exception as e:
+            with self._jobs_lock:
+                if self._sessions.get(session) != token:
+                    return unchanged
+            return None, "", None, f"❌ Error: {str(e)}"
+        finally:
+            # Without a job, wait_for_pdf returns early and would never clear the session entry
+            if not registered:
+                with self._jobs_lock:
+                    if self._sessions.get(session) == token:
+                        self._sessions.pop(session, None)
+    
+    def wait_for_pdf(self, job_id, request: gr.Request = None):
+        """Block until the background compile finishes; leave outputs alone if it was superseded"""
+        session = self._session_key(request, job_id)
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+            current = job_id is not None and self._sessions.get(session) == job_id
+        if not job or not current:
+            return gr.update(), gr.update()
+        
+        future, cancel_event = job[:2]
+        pdf_path = future.result()
+        with self._jobs_lock:
+            self._jobs.pop(job_id, None)
+            current = self._sessions.get(session) == job_id
+            if current:
+                self._sessions.pop(session, None)
+        
+        if not current or cancel_event.is_set():
+            return gr.update(), gr.update()
+        if pdf_path and os.path.exists(pdf_path):
+            return pdf_path, "✅ Resume generated successfully!"
+        return None, "❌ PDF compilation failed - preview shown above"
+
+    def generate_resumes_for_jobs(self, full_name, email, phone, location, linkedin, portfolio,
+                                  summary, experience, education, projects, skills, certifications,
+                                  job_description, additional_job_descriptions, request: gr.Request = None):
+        """Parse the profile once, then tailor and compile one resume per job description.
+
+        A new batch from the same session cancels the previous one and its outputs are dropped.
+        """
+        cancel_event = threading.Event()
+        session = self._session_key(request, uuid.uuid4().hex)
+        with self._jobs_lock:
+            previous = self._batches.get(session)
+            self._batches[session] = cancel_event
+        if previous:
+            previous.set()
+        
+        try:
+            if not self.api_key and self.model is None and not self.offline:
+                return None, "❌ Gemini API key not found in .env file"
+            
+            candidates = [job_description or ""] + JOB_SEPARATOR.split(additional_job_descriptions or "")
+            job_descriptions = [jd.strip() for jd in candidates if jd.strip()]
+            if not job_descriptions:
+                return None, "❌ Add at least one target job description"
+            
+            generator = self._create_generator()
+            
+            raw_data = self._build_raw_data(full_name, email, phone, location, linkedin, portfolio,
+                                            summary, experience, education, projects, skills, certifications)
+            
+            pdf_paths = generator.generate_resumes_for_jobs(
+                raw_data, job_descriptions, self._output_name(),
+                compile_pool=self.batch_compile_pool, cancel_event=cancel_event)
+            if cancel_event.is_set():
+                return gr.update(), gr.update()
+            generated = [path for path in pdf_paths if path and os.path.exists(path)]
+            
+            if not generated:
+                return None, "❌ Resume generation failed"
+            if len(generated) < len(job_descriptions):
+                return generated, f"⚠️ Generated {len(generated)} of {len(job_descriptions)} resumes"
+            return generated, f"✅ Generated {len(generated)} tailored resumes!"
+            
+        except Exception as e:
+            return None, f"❌ Error: {str(e)}"
+        finally:
+            with self._jobs_lock:
+                if self._batches.get(session) is cancel_event:
+                    self._batches.pop(session, None)
 
     def load_sample(self, sample_type):
         samples = {
@@ -63,6 +248,8 @@ def create_interface():
     app = ResumeApp()
     
     with gr.Blocks(title="AI Resume Generator") as interface:
+        job_state = gr.State(None)
+        
         gr.Markdown("# 🤖 AI Resume Generator")
         gr.Markdown("Create professional resumes with AI enhancement")
         
@@ -89,6 +276,8 @@ def create_interface():
                 
                 job_description = gr.Textbox(label="Target Job Description (Optional)", lines=8,
                     placeholder="Paste job description for AI optimization...")
+                additional_job_descriptions = gr.Textbox(label="Additional Job Descriptions (Optional)", lines=8,
+                    placeholder="Paste more job descriptions, separated by a line containing ---")
             
             with gr.Column():
                 sample_dropdown = gr.Dropdown(
@@ -97,9 +286,12 @@ def create_interface():
                 )
                 load_btn = gr.Button("Load Sample")
                 generate_btn = gr.Button("Generate Resume", variant="primary")
+                generate_all_btn = gr.Button("Generate for All Jobs")
                 
                 status = gr.Markdown("Ready to generate resume")
                 pdf_output = gr.File(label="Generated Resume", file_types=[".pdf"])
+                batch_output = gr.File(label="Tailored Resumes", file_count="multiple", file_types=[".pdf"])
+                preview_output = gr.HTML(label="Preview")
         
         # Event handlers
         load_btn.click(
@@ -109,11 +301,29 @@ def create_interface():
                     summary, experience, education, projects, skills, certifications]
         )
         
+        # Preview shows as soon as the enhanced JSON is ready; the PDF is attached when the
+        # background compile finishes. A new click supersedes this session's earlier clicks.
         generate_btn.click(
-            app.generate_resume,
+            app.preview_resume,
             inputs=[full_name, email, phone, location, linkedin, portfolio,
                    summary, experience, education, projects, skills, certifications, job_description],
-            outputs=[pdf_output, status]
+            outputs=[job_state, preview_output, pdf_output, status],
+            trigger_mode="multiple",
+            concurrency_limit=None
+        ).then(
+            app.wait_for_pdf,
+            inputs=[job_state],
+            outputs=[pdf_output, status],
+            concurrency_limit=None
+        )
+        
+        generate_all_btn.click(
+            app.generate_resumes_for_jobs,
+            inputs=[full_name, email, phone, location, linkedin, portfolio, summary, experience,
+                   education, projects, skills, certifications, job_description, additional_job_descriptions],
+            outputs=[batch_output, status],
+            trigger_mode="multiple",
+            concurrency_limit=None
         )
     
     return interface
@@ -0,0 +1,101 @@
+"""
+Parsed-profile cache for multi-target mode - bounded LRU with TTL and single-flight loads
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, Callable, Tuple
+
+
+class ProfileCache:
+    """Thread-safe LRU of parsed profiles.
+
+    Entries expire after ``ttl_seconds`` and at most ``max_entries`` are kept. Concurrent
+    misses for the same key share one computation through a per-key future. Disk
+    persistence is off unless ``cache_dir`` is given; files older than the TTL are deleted
+    when read.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 3600.0, cache_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: str,
+                       compute: Callable[[], Tuple[Dict[str, Any], bool]]) -> Dict[str, Any]:
+        """Return a copy of the cached profile, or run compute() -> (profile, cacheable) once per key"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return copy.deepcopy(entry[1])
+                del self._entries[key]
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._pending[key] = future
+
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            profile = self._load_from_disk(key)
+            cacheable = profile is not None
+            if profile is None:
+                profile, cacheable = compute()
+                if cacheable:
+                    self._save_to_disk(key, profile)
+            if cacheable:
+                with self._lock:
+                    self._entries[key] = (time.monotonic() + self.ttl_seconds, profile)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            future.set_result(profile)
+            return copy.deepcopy(profile)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_from_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                os.remove(path)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _save_to_disk(self, key: str, profile: Dict[str, Any]):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(key), 'w', encoding='utf-8') as f:
+                json.dump(profile, f, indent=2)
+        except OSError:
+            pass
@@ -2,34 +2,90 @@
 AI Resume Generator - Clean implementation
 """
 
+import copy
+import hashlib
+import html
+import inspect
 import json
 import re
 import os
 import subprocess
 import tempfile
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Executor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
 import google.generativeai as genai
 
 load_dotenv()
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from prompts.enhancement_prompts import ENHANCE_RESUME_PROMPT, BASIC_ENHANCEMENT_PROMPT
+from prompts.enhancement_prompts import (
+    ENHANCE_RESUME_PROMPT, BASIC_ENHANCEMENT_PROMPT, PARSE_PROFILE_PROMPT, TAILOR_RESUME_PROMPT,
+    REWRITE_CONTENT_PROMPT
+)
+from parsers import resume_parser
+from parsers.resume_parser import parse_resume_fields, is_complete
+from ai.profile_cache import ProfileCache
 from templates.latex_templates import MINIMAL_TECH_TEMPLATE
+from templates.html_templates import TECH_PREVIEW_TEMPLATE
+
+# Profiles hold personal data: kept in memory only unless RESUME_PROFILE_CACHE_DIR is set
+PROFILE_CACHE_DIR = os.getenv('RESUME_PROFILE_CACHE_DIR') or None
+
+# Changes whenever a prompt that shapes the cached profile changes, invalidating old entries
+PROFILE_PROMPT_VERSION = hashlib.sha256(
+    (PARSE_PROFILE_PROMPT + REWRITE_CONTENT_PROMPT).encode('utf-8')).hexdigest()[:12]
+
+# Same for the local parser: any change to what _preparse produces invalidates old entries
+PROFILE_PARSER_VERSION = hashlib.sha256(inspect.getsource(resume_parser).encode('utf-8')).hexdigest()[:12]
 
 class AIResumeGenerator:
-    def __init__(self, api_key: str = None, template_type: str = "tech"):
-        if api_key is None:
-            api_key = os.getenv('GEMINI_API_KEY')
-            if not api_key:
-                raise ValueError("GEMINI_API_KEY not found")
-        
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+    # Parsed profiles shared by every generator in the process
+    _profile_cache = ProfileCache(
+        max_entries=int(os.getenv('RESUME_PROFILE_CACHE_SIZE', '128')),
+        ttl_seconds=float(os.getenv('RESUME_PROFILE_CACHE_TTL', '3600')),
+        cache_dir=PROFILE_CACHE_DIR
+    )
+    
+    def __init__(self, api_key: str = None, template_type: str = "tech", model: Any = None,
+                 preparse: bool = True, offline: bool = False):
+        # preparse: extract structure locally so the LLM only rewrites prose (falls back to full
+        # parsing when the input doesn't match the line formats); offline: never call the LLM
+        self.preparse = preparse
+        self.offline = offline
+        if offline:
+            self.model = model
+        elif model is not None:
+            # Any object exposing generate_content(prompt) -> response.text, e.g. the offline stand-in
+            self.model = model
+        else:
+            if api_key is None:
+                api_key = os.getenv('GEMINI_API_KEY')
+                if not api_key:
+                    raise ValueError("GEMINI_API_KEY not found")
+            
+            genai.configure(api_key=api_key)
+            self.model = genai.GenerativeModel('gemini-1.5-flash')
         self.template = MINIMAL_TECH_TEMPLATE
+        self.preview_template = TECH_PREVIEW_TEMPLATE
         
     def enhance_resume_with_ai(self, raw_data: Dict[str, Any], job_description: str = "") -> Dict[str, Any]:
+        parsed = self._preparse(raw_data)
+        if parsed is not None:
+            if self.offline:
+                return parsed
+            try:
+                enhanced = self._rewrite_prose(
+                    parsed, REWRITE_CONTENT_PROMPT, job_description or "No specific job description provided")
+            except Exception:
+                # API failure (not a bad reply): the larger prompts would fail the same way
+                return self._with_defaults(parsed)
+            if enhanced:
+                return enhanced
+        
         try:
             input_data_str = self._format_input_data(raw_data)
             prompt = ENHANCE_RESUME_PROMPT.format(
@@ -48,6 +104,15 @@ class AIResumeGenerator:
         except Exception as e:
             return self._fallback_enhancement(raw_data)
     
+    def _preparse(self, raw_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Locally parsed resume, or None when the LLM should parse the raw text itself"""
+        if not (self.preparse or self.offline):
+            return None
+        parsed = parse_resume_fields(raw_data)
+        if self.offline or is_complete(raw_data, parsed):
+            return parsed
+        return None
+    
     def _format_input_data(self, raw_data: Dict[str, Any]) -> str:
         formatted_lines = []
         for key, value in raw_data.items():
@@ -85,19 +150,23 @@ class AIResumeGenerator:
         return self._clean_raw_data(raw_data)
     
     def _clean_raw_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        # Free-text sections go through the local parser so the formatters always get dicts
+        return self._with_defaults(parse_resume_fields(raw_data))
+    
+    def _with_defaults(self, parsed: Dict[str, Any]) -> Dict[str, Any]:
         return {
-            "full_name": raw_data.get("full_name", "Your Name"),
-            "email": raw_data.get("email", "your.email@example.com"),
-            "phone": raw_data.get("phone", "+1-xxx-xxx-xxxx"),
-            "location": raw_data.get("location", "Your Location"),
-            "linkedin": raw_data.get("linkedin", "linkedin.com/in/yourprofile"),
-            "portfolio": raw_data.get("portfolio", "yourportfolio.com"),
-            "summary": raw_data.get("summary", "Professional summary"),
-            "experience": raw_data.get("experience", []),
-            "education": raw_data.get("education", []),
-            "projects": raw_data.get("projects", []),
-            "skills": raw_data.get("skills", "Skills"),
-            "certifications": raw_data.get("certifications", [])
+            "full_name": parsed["full_name"] or "Your Name",
+            "email": parsed["email"] or "your.email@example.com",
+            "phone": parsed["phone"] or "+1-xxx-xxx-xxxx",
+            "location": parsed["location"] or "Your Location",
+            "linkedin": parsed["linkedin"] or "linkedin.com/in/yourprofile",
+            "portfolio": parsed["portfolio"] or "yourportfolio.com",
+            "summary": parsed["summary"] or "Professional summary",
+            "experience": parsed["experience"],
+            "education": parsed["education"],
+            "projects": parsed["projects"],
+            "skills": parsed["skills"] or "Skills",
+            "certifications": parsed["certifications"]
         }
     
     def generate_latex_content(self, enhanced_data: Dict[str, Any]) -> str:
@@ -181,8 +250,8 @@ class AIResumeGenerator:
         for exp in experience_list:
             title = exp.get("title", "Job Title")
             company = exp.get("company", "Company Name")
-            date_start = exp.get("date_start", "Start")
-            date_end = exp.get("date_end", "End")
+            date_start = exp.get("date_start", "")
+            date_end = exp.get("date_end", "")
             
             content += f"\\jobtitle{{{title}}}{{{company}}}{{{date_start}}}{{{date_end}}}\n"
             
@@ -201,7 +270,7 @@ class AIResumeGenerator:
         for edu in education_list:
             degree = edu.get("degree", "Degree")
             institution = edu.get("institution", "Institution")
-            date = edu.get("date", "Date")
+            date = edu.get("date", "")
             
             content += f"\\education{{{degree}}}{{{institution}}}{{{date}}}\n"
             
@@ -219,7 +288,7 @@ class AIResumeGenerator:
         content = "\\sectiontitle{Key Projects}\n"
         for proj in projects_list:
             name = proj.get("name", "Project Name")
-            date_range = f"{proj.get('date_start', 'Start')} - {proj.get('date_end', 'End')}"
+            date_range = " - ".join(d for d in (proj.get('date_start', ''), proj.get('date_end', '')) if d)
             tech_stack = ", ".join(proj.get("technologies", [])) if proj.get("technologies") else ""
             
             content += f"\\projectheader{{{name}}}{{{date_range}}}{{{tech_stack}}}\n"
@@ -239,15 +308,120 @@ class AIResumeGenerator:
         for cert in certifications_list:
             name = cert.get("name", "Certification Name")
             issuer = cert.get("issuer", "Issuing Organization")
-            date = cert.get("date", "Date")
+            date = cert.get("date", "")
             
             content += f"\\noindent\\textbf{{{name} - {issuer}}} \\hfill \\textit{{{date}}}\\\\[2pt]\n"
         
         return content
     
-    def compile_latex_to_pdf(self, latex_content: str, output_name: str = "resume") -> Optional[str]:
-        """Compile LaTeX to PDF with better error handling"""
+    def generate_html_preview(self, enhanced_data: Dict[str, Any]) -> str:
+        """Render an HTML approximation of the tech template - milliseconds vs. seconds for pdflatex"""
+        template_vars = {
+            "full_name": self._escape_html(enhanced_data.get("full_name", "Your Name")),
+            "email": self._escape_html(enhanced_data.get("email", "your.email@example.com")),
+            "phone": self._escape_html(enhanced_data.get("phone", "+1-xxx-xxx-xxxx")),
+            "location": self._escape_html(enhanced_data.get("location", "Your Location")),
+            "linkedin_url": self._escape_html(self._format_url(enhanced_data.get("linkedin", ""))),
+            "portfolio_url": self._escape_html(self._format_url(enhanced_data.get("portfolio", ""))),
+            "summary": self._escape_html(enhanced_data.get("summary", "Professional summary")),
+            "experience_section": self._format_experience_html(enhanced_data.get("experience", [])),
+            "education_section": self._format_education_html(enhanced_data.get("education", [])),
+            "projects_section": self._format_projects_html(enhanced_data.get("projects", [])),
+            "skills": self._escape_html(enhanced_data.get("skills", "Skills")),
+            "certifications_section": self._format_certifications_html(enhanced_data.get("certifications", []))
+        }
+        
+        return self.preview_template.format(**template_vars)
+    
+    def _escape_html(self, value: Any) -> str:
+        return html.escape(str(value)) if value else ""
+    
+    def _html_entry(self, left_top: str, right_top: str, left_bottom: str, right_bottom: str, bullets: list) -> str:
+        content = '<div class="resume-preview-entry">\n'
+        content += (f'<div class="resume-preview-row"><span class="resume-preview-strong">{left_top}</span>'
+                    f'<span class="resume-preview-strong">{right_top}</span></div>\n')
+        content += (f'<div class="resume-preview-row"><span class="resume-preview-muted">{left_bottom}</span>'
+                    f'<span class="resume-preview-muted">{right_bottom}</span></div>\n')
+        for bullet in bullets:
+            content += f'<div class="resume-preview-bullet">&bull; {self._escape_html(bullet)}</div>\n'
+        content += '</div>\n'
+        return content
+    
+    def _format_experience_html(self, experience_list: list) -> str:
+        content = '<div class="resume-preview-section">Professional Experience</div>\n'
+        if not experience_list:
+            return content + "<div>No experience provided.</div>\n"
+        
+        for exp in experience_list:
+            content += self._html_entry(
+                self._escape_html(exp.get("title", "Job Title")),
+                self._escape_html(exp.get("company", "Company Name")),
+                self._escape_html(exp.get("date_start", "")),
+                self._escape_html(exp.get("date_end", "")),
+                exp.get("highlights", [])
+            )
+        
+        return content
+    
+    def _format_education_html(self, education_list: list) -> str:
+        content = '<div class="resume-preview-section">Education</div>\n'
+        if not education_list:
+            return content + "<div>Education information to be provided.</div>\n"
+        
+        for edu in education_list:
+            content += self._html_entry(
+                self._escape_html(edu.get("degree", "Degree")),
+                self._escape_html(edu.get("date", "")),
+                self._escape_html(edu.get("institution", "Institution")),
+                "",
+                edu.get("details", [])
+            )
+        
+        return content
+    
+    def _format_projects_html(self, projects_list: list) -> str:
+        content = '<div class="resume-preview-section">Key Projects</div>\n'
+        if not projects_list:
+            return content + "<div>Key projects to be added.</div>\n"
+        
+        for proj in projects_list:
+            date_range = " - ".join(d for d in (proj.get('date_start', ''), proj.get('date_end', '')) if d)
+            tech_stack = ", ".join(proj.get("technologies", [])) if proj.get("technologies") else ""
+            content += self._html_entry(
+                self._escape_html(proj.get("name", "Project Name")),
+                self._escape_html(date_range),
+                self._escape_html(tech_stack),
+                "",
+                proj.get("description", [])
+            )
+        
+        return content
+    
+    def _format_certifications_html(self, certifications_list: list) -> str:
+        if not certifications_list:
+            return ""
+        
+        content = '<div class="resume-preview-section">Certifications</div>\n'
+        for cert in certifications_list:
+            name = self._escape_html(cert.get("name", "Certification Name"))
+            issuer = self._escape_html(cert.get("issuer", "Issuing Organization"))
+            date = self._escape_html(cert.get("date", ""))
+            content += (f'<div class="resume-preview-row"><span class="resume-preview-strong">{name} - {issuer}</span>'
+                        f'<span class="resume-preview-muted">{date}</span></div>\n')
+        
+        return content
+    
+    def compile_latex_to_pdf(self, latex_content: str, output_name: str = "resume",
+                             cancel_event: Optional[threading.Event] = None) -> Optional[str]:
+        """Compile LaTeX to PDF with better error handling
+
+        Setting cancel_event kills a running pdflatex (or skips a queued one) and returns None.
+        """
         try:
+            if cancel_event is not None and cancel_event.is_set():
+                print("⏹️ LaTeX compilation cancelled")
+                return None
+            
             # Create output directory if it doesn't exist
             os.makedirs("output", exist_ok=True)
             
@@ -260,12 +434,16 @@ class AIResumeGenerator:
             
             # Compile with simpler approach
             try:
-                result = subprocess.run([
+                stdout, stderr = self._run_pdflatex([
                     'pdflatex', 
                     '-interaction=nonstopmode',
                     '-output-directory=output',
                     tex_file
-                ], capture_output=True, text=True, timeout=30, cwd=os.getcwd())
+                ], timeout=30, cancel_event=cancel_event)
+                
+                if cancel_event is not None and cancel_event.is_set():
+                    print("⏹️ LaTeX compilation cancelled")
+                    return None
                 
                 pdf_file = f"output/{output_name}.pdf"
                 
@@ -278,8 +456,8 @@ class AIResumeGenerator:
                     return final_pdf
                 else:
                     print(f"❌ PDF not created. LaTeX errors:")
-                    print(result.stdout[-500:] if result.stdout else "No stdout")
-                    print(result.stderr[-500:] if result.stderr else "No stderr")
+                    print(stdout[-500:] if stdout else "No stdout")
+                    print(stderr[-500:] if stderr else "No stderr")
                     return None
                     
             except subprocess.TimeoutExpired:
@@ -293,8 +471,188 @@ class AIResumeGenerator:
             print(f"❌ PDF compilation error: {str(e)}")
             return None
     
+    def _run_pdflatex(self, args: list, timeout: float, cancel_event: Optional[threading.Event] = None):
+        """Run pdflatex, polling cancel_event so a superseded compile can be killed mid-run"""
+        process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   text=True, cwd=os.getcwd())
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return process.communicate(timeout=0.2)
+            except subprocess.TimeoutExpired:
+                cancelled = cancel_event is not None and cancel_event.is_set()
+                if cancelled or time.monotonic() > deadline:
+                    process.kill()
+                    process.communicate()
+                    if cancelled:
+                        return None, None
+                    raise
+    
     def generate_resume(self, raw_data: Dict[str, Any], job_description: str = "", 
                        output_name: str = "resume") -> Optional[str]:
         enhanced_data = self.enhance_resume_with_ai(raw_data, job_description)
         latex_content = self.generate_latex_content(enhanced_data)
-        return self.compile_latex_to_pdf(latex_content, output_name)
\ No newline at end of file
+        return self.compile_latex_to_pdf(latex_content, output_name)
+    
+    def parse_profile(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Phase 1 of multi-target mode: parse raw input into a job-agnostic profile once.
+
+        Results are cached (see ProfileCache), keyed by the raw input, the prompt and parser
+        versions and the preparse setting.
+        """
+        if self.offline:
+            return self._preparse(raw_data)
+        
+        cache_key = hashlib.sha256(json.dumps(
+            {"raw_data": raw_data, "prompt_version": PROFILE_PROMPT_VERSION,
+             "parser_version": PROFILE_PARSER_VERSION, "preparse": self.preparse},
+            sort_keys=True
+        ).encode('utf-8')).hexdigest()
+        return self._profile_cache.get_or_compute(cache_key, lambda: self._compute_profile(raw_data))
+    
+    def _compute_profile(self, raw_data: Dict[str, Any]):
+        """Returns (profile, cacheable); fallback results are not cached so a later call can retry"""
+        parsed = self._preparse(raw_data)
+        if parsed is not None:
+            try:
+                profile = self._rewrite_prose(
+                    parsed, REWRITE_CONTENT_PROMPT,
+                    "No specific job description - keep wording broadly applicable to many roles")
+            except Exception:
+                return self._with_defaults(parsed), False
+            if profile:
+                return profile, True
+        
+        try:
+            prompt = PARSE_PROFILE_PROMPT.format(input_data=self._format_input_data(raw_data))
+            response = self.model.generate_content(prompt)
+            profile = self._extract_json_from_response(response.text.strip())
+        except Exception:
+            profile = None
+        
+        if not profile:
+            return self._fallback_enhancement(raw_data), False
+        return profile, True
+    
+    def tailor_profile(self, profile: Dict[str, Any], job_description: str) -> Dict[str, Any]:
+        """Phase 2: rewrite only summary, skills order and bullet emphasis for one job.
+
+        Only those fields are sent and returned, so the call is a fraction of a full enhancement.
+        Falls back to the untailored profile if the response is unusable.
+        """
+        if self.offline or not job_description or not job_description.strip():
+            return copy.deepcopy(profile)
+        try:
+            return self._rewrite_prose(profile, TAILOR_RESUME_PROMPT, job_description) or copy.deepcopy(profile)
+        except Exception:
+            return copy.deepcopy(profile)
+    
+    def _rewrite_prose(self, profile: Dict[str, Any], prompt_template: str,
+                       job_description: str) -> Optional[Dict[str, Any]]:
+        """Send only summary, skills and indexed bullets; merge the rewrites into a copy of profile.
+
+        Returns None if the response is unusable; errors from the model call propagate so
+        callers can tell an outage from a bad reply.
+        """
+        rewritten = copy.deepcopy(profile)
+        experience = [e for e in rewritten.get("experience", []) if isinstance(e, dict)]
+        projects = [p for p in rewritten.get("projects", []) if isinstance(p, dict)]
+        profile_data = {
+            "summary": rewritten.get("summary", ""),
+            "skills": rewritten.get("skills", ""),
+            "experience": [
+                {"index": i, "title": exp.get("title", ""), "company": exp.get("company", ""),
+                 "highlights": exp.get("highlights", [])}
+                for i, exp in enumerate(experience)
+            ],
+            "projects": [
+                {"index": i, "name": proj.get("name", ""), "technologies": proj.get("technologies", []),
+                 "description": proj.get("description", [])}
+                for i, proj in enumerate(projects)
+            ]
+        }
+        
+        prompt = prompt_template.format(
+            job_description=job_description,
+            profile_data=json.dumps(profile_data, indent=2)
+        )
+        response = self.model.generate_content(prompt)
+        try:
+            changes = self._extract_json_from_response(response.text.strip())
+        except Exception:
+            changes = None
+        
+        if not isinstance(changes, dict):
+            return None
+        
+        if isinstance(changes.get("summary"), str) and changes["summary"].strip():
+            rewritten["summary"] = changes["summary"]
+        if isinstance(changes.get("skills"), str) and changes["skills"].strip():
+            rewritten["skills"] = changes["skills"]
+        self._apply_bullet_changes(experience, changes.get("experience"), "highlights")
+        self._apply_bullet_changes(projects, changes.get("projects"), "description")
+        
+        return rewritten
+    
+    def _apply_bullet_changes(self, entries: list, changes: Any, field: str):
+        if not isinstance(changes, list):
+            return
+        for change in changes:
+            if not isinstance(change, dict):
+                continue
+            index = change.get("index")
+            bullets = change.get(field)
+            if (isinstance(index, int) and 0 <= index < len(entries)
+                    and isinstance(bullets, list) and bullets
+                    and all(isinstance(b, str) for b in bullets)):
+                entries[index][field] = bullets
+    
+    def generate_resumes_for_jobs(self, raw_data: Dict[str, Any], job_descriptions: List[str],
+                                  output_prefix: str = "resume", max_workers: int = 4,
+                                  compile_pool: Optional[Executor] = None,
+                                  cancel_event: Optional[threading.Event] = None) -> List[Optional[str]]:
+        """Parse once, tailor per job concurrently, render/compile through one shared pool.
+
+        Returns one PDF path (or None on failure) per job description, in input order.
+        Setting cancel_event skips pending tailoring passes and kills running compiles.
+        """
+        profile = self.parse_profile(raw_data)
+        own_pool = compile_pool is None
+        if own_pool:
+            compile_pool = ThreadPoolExecutor(max_workers=2)
+        
+        def cancelled() -> bool:
+            return cancel_event is not None and cancel_event.is_set()
+        
+        def tailor(jd: str) -> Dict[str, Any]:
+            return profile if cancelled() else self.tailor_profile(profile, jd)
+        
+        def render_and_compile(tailored: Dict[str, Any], index: int) -> Optional[str]:
+            if cancelled():
+                return None
+            latex_content = self.generate_latex_content(tailored)
+            return self.compile_latex_to_pdf(latex_content, f"{output_prefix}_{index + 1}", cancel_event)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(job_descriptions) or 1))) as tailor_pool:
+                tailor_futures = {
+                    tailor_pool.submit(tailor, jd): index
+                    for index, jd in enumerate(job_descriptions)
+                }
+                # Each tailoring pass hands off to the compile pool as soon as it finishes
+                compile_futures = [None] * len(job_descriptions)
+                for future in as_completed(tailor_futures):
+                    index = tailor_futures[future]
+                    compile_futures[index] = compile_pool.submit(render_and_compile, future.result(), index)
+            
+            results = []
+            for future in compile_futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"❌ Resume generation error: {str(e)}")
+                    results.append(None)
+            return results
+        finally:
+            if own_pool:
+                compile_pool.shutdown(wait=True)
@@ -0,0 +1,182 @@
+"""
+Offline Gemini stand-in - synthetic latency, errors and response sizes for load testing
+"""
+
+import json
+import math
+import random
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+class FakeGeminiError(Exception):
+    """Base class for errors injected by the stand-in"""
+
+
+class ResourceExhausted(FakeGeminiError):
+    """Mimics a 429 quota error"""
+
+
+class ServiceUnavailable(FakeGeminiError):
+    """Mimics a 503 from the Gemini backend"""
+
+
+class DeadlineExceeded(FakeGeminiError):
+    """Mimics a request that timed out upstream"""
+
+
+ERROR_TYPES = [ResourceExhausted, ServiceUnavailable, DeadlineExceeded]
+
+# Number of experience entries / bullets per entry / projects / certifications
+RESPONSE_SIZES = {
+    "small": {"experience": 1, "bullets": 2, "projects": 1, "certifications": 0},
+    "medium": {"experience": 2, "bullets": 3, "projects": 2, "certifications": 1},
+    "large": {"experience": 5, "bullets": 5, "projects": 4, "certifications": 3},
+}
+
+LATENCY_DISTRIBUTIONS = ["constant", "uniform", "normal", "lognormal"]
+
+
+class LatencyProfile:
+    """Samples per-call latency in seconds.
+
+    ``median`` is the centre of the distribution; ``spread`` is the half-width for
+    uniform, the standard deviation for normal and the log-space sigma for lognormal.
+    """
+
+    def __init__(self, distribution: str = "lognormal", median: float = 1.5, spread: float = 0.4):
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.distribution = distribution
+        self.median = median
+        self.spread = spread
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "constant":
+            value = self.median
+        elif self.distribution == "uniform":
+            value = rng.uniform(self.median - self.spread, self.median + self.spread)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.median, self.spread)
+        else:
+            value = self.median * math.exp(rng.gauss(0.0, self.spread))
+        return max(0.0, value)
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGeminiModel:
+    """Drop-in for ``genai.GenerativeModel`` exposing ``generate_content(prompt)``.
+
+    Safe to share across threads; counters are kept in ``stats`` for the harness.
+    """
+
+    def __init__(self, latency: Optional[LatencyProfile] = None, error_rate: float = 0.0,
+                 malformed_rate: float = 0.0, response_size: str = "medium", seed: Optional[int] = None):
+        if response_size not in RESPONSE_SIZES:
+            raise ValueError(f"Unknown response size: {response_size}")
+        self.latency = latency or LatencyProfile()
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.response_size = response_size
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {"calls": 0, "prompt_chars": 0, "response_chars": 0, "malformed": 0, "errors": {}}
+
+    def snapshot_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return json.loads(json.dumps(self.stats))
+
+    def generate_content(self, prompt: str) -> FakeResponse:
+        with self._lock:
+            delay = self.latency.sample(self._rng)
+            roll = self._rng.random()
+            error_type = self._rng.choice(ERROR_TYPES)
+            self.stats["calls"] += 1
+            self.stats["prompt_chars"] += len(prompt)
+
+        time.sleep(delay)
+
+        if roll < self.error_rate:
+            with self._lock:
+                name = error_type.__name__
+                self.stats["errors"][name] = self.stats["errors"].get(name, 0) + 1
+            raise error_type(f"Injected {name} after {delay:.3f}s")
+
+        if roll < self.error_rate + self.malformed_rate:
+            text = "I'm sorry, I couldn't produce structured output for this resume."
+            with self._lock:
+                self.stats["malformed"] += 1
+        elif '"index"' in prompt:
+            # Rewrite-only prompts (pre-parsed / tailoring) get the compact index-keyed reply
+            text = "```json\n" + json.dumps(self._build_rewrite(), indent=2) + "\n```"
+        else:
+            text = "```json\n" + json.dumps(self._build_resume(), indent=2) + "\n```"
+
+        with self._lock:
+            self.stats["response_chars"] += len(text)
+        return FakeResponse(text)
+
+    def _build_rewrite(self) -> Dict[str, Any]:
+        resume = self._build_resume()
+        return {
+            "summary": resume["summary"],
+            "skills": resume["skills"],
+            "experience": [{"index": i, "highlights": e["highlights"]} for i, e in enumerate(resume["experience"])],
+            "projects": [{"index": i, "description": p["description"]} for i, p in enumerate(resume["projects"])],
+        }
+
+    def _build_resume(self) -> Dict[str, Any]:
+        size = RESPONSE_SIZES[self.response_size]
+        bullet = ("Delivered a measurable improvement of 35% across 1M+ requests by redesigning "
+                  "the service layer with Python, AWS and Kubernetes")
+        return {
+            "full_name": "Load Test Candidate",
+            "email": "candidate@example.com",
+            "phone": "+1-555-000-0000",
+            "location": "San Francisco, CA",
+            "linkedin": "https://linkedin.com/in/loadtest",
+            "portfolio": "https://loadtest.dev",
+            "summary": "Software engineer with 5+ years of experience building scalable systems. " * 4,
+            "experience": [
+                {
+                    "title": f"Software Engineer {i + 1}",
+                    "company": f"Company {i + 1}",
+                    "date_start": "2020-01",
+                    "date_end": "Present" if i == 0 else "2022-12",
+                    "highlights": [f"{bullet} (item {j + 1})" for j in range(size["bullets"])],
+                }
+                for i in range(size["experience"])
+            ],
+            "education": [
+                {
+                    "degree": "Bachelor of Science in Computer Science",
+                    "institution": "Stanford University",
+                    "date": "2019-06",
+                    "details": ["GPA: 3.8/4.0"],
+                }
+            ],
+            "projects": [
+                {
+                    "name": f"Project {i + 1}",
+                    "date_start": "2023-01",
+                    "date_end": "2023-06",
+                    "technologies": ["Python", "React", "AWS"],
+                    "description": [f"{bullet} (item {j + 1})" for j in range(size["bullets"])],
+                }
+                for i in range(size["projects"])
+            ],
+            "skills": "Programming Languages: Python, JavaScript | Frameworks: React, Node.js | Cloud/Tools: AWS, Docker",
+            "certifications": [
+                {"name": f"Certification {i + 1}", "issuer": "Amazon Web Services", "date": "2023-01"}
+                for i in range(size["certifications"])
+            ],
+        }
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Offline load-testing harness - drives resume generation at target request rates
+
+Uses the FakeGeminiModel stand-in instead of the real API and, by default, a stub
+pdflatex placed on PATH so no TeX install is required. Requests are issued open-loop
+(on a fixed schedule) and latency is measured from the scheduled start, so queueing
+delay shows up in the percentiles once the service saturates.
+
+Example:
+    python src/loadtest/harness.py --rates 1,2,4,8,16 --duration 20 --workers 16
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Callable, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(ROOT_DIR, 'src'))
+
+from loadtest.fake_gemini import FakeGeminiModel, LatencyProfile, RESPONSE_SIZES, LATENCY_DISTRIBUTIONS
+
+SAMPLE_INPUT = {
+    "full_name": "Alex Johnson", "email": "alex.johnson@email.com", "phone": "+1-555-0123",
+    "location": "San Francisco, CA", "linkedin": "linkedin.com/in/alexjohnson", "portfolio": "alexjohnson.dev",
+    "summary": "Experienced software engineer with 5+ years developing scalable web applications",
+    "experience": "Senior Software Engineer at TechCorp Inc.\n2022 - Present\nLed development of microservices architecture serving 1M+ users",
+    "education": "Bachelor of Science in Computer Science\nStanford University\n2019\nGPA: 3.8/4.0",
+    "projects": "E-commerce Platform\nFull-stack web application with React and Node.js\nDeployed to production with 500+ users",
+    "skills": "Python, JavaScript, React, Node.js, AWS, Docker, Kubernetes",
+    "certifications": "AWS Certified Solutions Architect\nAmazon Web Services\n2023",
+}
+
+SAMPLE_JOB_DESCRIPTION = "Senior Backend Engineer - Python, AWS, Kubernetes, distributed systems"
+
+# Minimal valid single-page PDF written by the stub compiler
+STUB_PDF = (b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+            b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+            b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\n"
+            b"trailer<</Root 1 0 R>>\n%%EOF\n")
+
+STUB_PDFLATEX = '''#!{python}
+import os, sys, time
+time.sleep({latency})
+out_dir = "."
+tex_file = None
+for arg in sys.argv[1:]:
+    if arg.startswith("-output-directory="):
+        out_dir = arg.split("=", 1)[1]
+    elif not arg.startswith("-"):
+        tex_file = arg
+if tex_file is None:
+    sys.exit(1)
+base = os.path.splitext(os.path.basename(tex_file))[0]
+with open(os.path.join(out_dir, base + ".pdf"), "wb") as f:
+    f.write({pdf!r})
+'''
+
+
+def install_stub_pdflatex(bin_dir: str, latency: float):
+    """Write a fake pdflatex into bin_dir and put it first on PATH"""
+    path = os.path.join(bin_dir, "pdflatex")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(STUB_PDFLATEX.format(python=sys.executable, latency=latency, pdf=STUB_PDF))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    os.environ["PATH"] = bin_dir + os.pathsep + os.environ.get("PATH", "")
+
+
+def _status_outcome(status) -> str:
+    return str(status).split(":")[0].lstrip("❌ ").strip() or "failed"
+
+
+def build_target(target: str, model: FakeGeminiModel, compile_workers: int = 2) -> Callable[[], Tuple[bool, str]]:
+    """Return a callable performing one request and reporting (ok, outcome)"""
+    if target == "app":
+        sys.path.append(ROOT_DIR)
+        from app import ResumeApp
+
+        resume_app = ResumeApp(api_key="offline", model=model, compile_workers=compile_workers)
+        fields = ["full_name", "email", "phone", "location", "linkedin", "portfolio", "summary",
+                  "experience", "education", "projects", "skills", "certifications"]
+
+        def run_app() -> Tuple[bool, str]:
+            # Same two steps the Generate button runs: preview, then wait on the shared compile pool
+            job_id, _, _, status = resume_app.preview_resume(
+                *[SAMPLE_INPUT[f] for f in fields], SAMPLE_JOB_DESCRIPTION)
+            if not job_id:
+                return False, _status_outcome(status)
+            pdf_path, status = resume_app.wait_for_pdf(job_id)
+            if isinstance(pdf_path, str) and os.path.exists(pdf_path):
+                return True, "ok"
+            return False, _status_outcome(status)
+
+        return run_app
+
+    from ai.resume_generator import AIResumeGenerator
+    counter = iter(range(10 ** 9))
+    counter_lock = threading.Lock()
+
+    def run_generator() -> Tuple[bool, str]:
+        with counter_lock:
+            n = next(counter)
+        generator = AIResumeGenerator(template_type="tech", model=model)
+        pdf_path = generator.generate_resume(dict(SAMPLE_INPUT), SAMPLE_JOB_DESCRIPTION, f"loadtest_{n}")
+        if pdf_path and os.path.exists(pdf_path):
+            return True, "ok"
+        return False, "no_pdf"
+
+    return run_generator
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    # Nearest-rank percentile
+    index = max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def _usage() -> Dict[str, float]:
+    if resource is None:
+        return {"cpu": time.process_time(), "child_cpu": 0.0, "max_rss_mb": 0.0}
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "cpu": own.ru_utime + own.ru_stime,
+        "child_cpu": children.ru_utime + children.ru_stime,
+        "max_rss_mb": own.ru_maxrss / scale,
+    }
+
+
+def run_level(request_fn: Callable[[], Tuple[bool, str]], model: FakeGeminiModel,
+              rate: float, duration: float, workers: int) -> Dict[str, Any]:
+    """Issue rate*duration requests on a fixed schedule and collect latency/outcomes"""
+    total = max(1, int(rate * duration))
+    latencies: List[float] = []
+    outcomes: Dict[str, int] = {}
+    results_lock = threading.Lock()
+    peak_threads = [threading.active_count()]
+    completions: List[float] = []
+
+    model.reset_stats()
+    usage_before = _usage()
+
+    def one_request(scheduled: float):
+        try:
+            ok, outcome = request_fn()
+        except Exception as e:
+            ok, outcome = False, type(e).__name__
+        finished = time.perf_counter()
+        elapsed = finished - scheduled
+        with results_lock:
+            if ok:
+                latencies.append(elapsed)
+                completions.append(finished)
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+            peak_threads[0] = max(peak_threads[0], threading.active_count())
+
+    start = time.perf_counter()
+    # The pipeline prints per-request progress; keep it out of the report
+    with contextlib.redirect_stdout(io.StringIO()), ThreadPoolExecutor(max_workers=workers) as pool:
+        for i in range(total):
+            scheduled = start + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(one_request, scheduled)
+    wall = time.perf_counter() - start
+
+    usage_after = _usage()
+    succeeded = outcomes.get("ok", 0)
+    # Completion rate between the 10th and 90th percentile completions. Both ends carry about one
+    # latency, so the offset cancels; measuring from start would report duration / (duration + latency)
+    # of the offered rate. Trimming the ends keeps a single slow or fast request from skewing it.
+    completions.sort()
+    lo, hi = len(completions) // 10, len(completions) - 1 - len(completions) // 10
+    if hi > lo and completions[hi] > completions[lo]:
+        throughput = (hi - lo) / (completions[hi] - completions[lo])
+    else:
+        throughput = succeeded * rate / total
+    return {
+        "offered_rps": rate,
+        "requests": total,
+        "succeeded": succeeded,
+        "throughput_rps": throughput,
+        "wall_s": wall,
+        "p50_s": percentile(latencies, 50),
+        "p95_s": percentile(latencies, 95),
+        "p99_s": percentile(latencies, 99),
+        "max_s": max(latencies) if latencies else 0.0,
+        "outcomes": outcomes,
+        "upstream": model.snapshot_stats(),
+        "resources": {
+            "cpu_s": usage_after["cpu"] - usage_before["cpu"],
+            "child_cpu_s": usage_after["child_cpu"] - usage_before["child_cpu"],
+            "max_rss_mb": usage_after["max_rss_mb"],
+            "peak_threads": peak_threads[0],
+        },
+    }
+
+
+def print_report(levels: List[Dict[str, Any]], saturation_ratio: float):
+    print("\n📈 Throughput / latency curve")
+    header = f"{'offered':>8} {'achieved':>9} {'ok':>6} {'err':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'cpu s':>7} {'tex cpu':>8} {'rss MB':>7} {'thr':>4}"
+    print(header)
+    print("-" * len(header))
+    for level in levels:
+        res = level["resources"]
+        errors = level["requests"] - level["succeeded"]
+        print(f"{level['offered_rps']:>8.2f} {level['throughput_rps']:>9.2f} {level['succeeded']:>6} {errors:>5} "
+              f"{level['p50_s']:>8.3f} {level['p95_s']:>8.3f} {level['p99_s']:>8.3f} "
+              f"{res['cpu_s']:>7.2f} {res['child_cpu_s']:>8.2f} {res['max_rss_mb']:>7.1f} {res['peak_threads']:>4}")
+
+    print("\n🧯 Error breakdown")
+    for level in levels:
+        failures = {k: v for k, v in level["outcomes"].items() if k != "ok"}
+        upstream = level["upstream"]
+        print(f"  {level['offered_rps']:.2f} rps: request failures={failures or '{}'} | "
+              f"gemini calls={upstream['calls']} injected={upstream['errors'] or '{}'} malformed={upstream['malformed']}")
+
+    print(f"\n🎯 Sustainability (no failures, achieved >= {saturation_ratio:.0%} of offered)")
+    sustainable = []
+    for level in levels:
+        reasons = []
+        errors = level["requests"] - level["succeeded"]
+        if errors:
+            reasons.append(f"{errors} failed request(s)")
+        if level["throughput_rps"] < saturation_ratio * level["offered_rps"]:
+            reasons.append(f"throughput {level['throughput_rps']:.2f} < {saturation_ratio:.0%} of offered")
+        if reasons:
+            print(f"  {level['offered_rps']:.2f} rps: not sustained - {'; '.join(reasons)}")
+        else:
+            print(f"  {level['offered_rps']:.2f} rps: sustained")
+            sustainable.append(level)
+    if sustainable:
+        print(f"\n✅ Highest sustainable rate: {max(l['offered_rps'] for l in sustainable):.2f} rps")
+    else:
+        print("\n❌ No tested rate was sustained (see reasons above)")
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Offline load test for the resume generation pipeline")
+    parser.add_argument("--target", choices=["generator", "app"], default="generator",
+                        help="Drive AIResumeGenerator.generate_resume directly, or the UI path "
+                             "(ResumeApp.preview_resume + wait_for_pdf through the shared compile pool)")
+    parser.add_argument("--rates", default="1,2,4,8", help="Comma-separated request rates (req/s) to sweep")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds of load per rate")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent worker threads (deployment size)")
+    parser.add_argument("--compile-workers", type=int, default=2,
+                        help="ResumeApp compile pool size for --target app")
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-median", type=float, default=1.5, help="Median Gemini latency in seconds")
+    parser.add_argument("--latency-spread", type=float, default=0.4, help="Distribution spread (see LatencyProfile)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of Gemini calls that raise")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of Gemini calls returning non-JSON")
+    parser.add_argument("--response-size", choices=sorted(RESPONSE_SIZES), default="medium")
+    parser.add_argument("--latex", choices=["stub", "real"], default="stub",
+                        help="Use a stub pdflatex (no TeX needed) or the installed one")
+    parser.add_argument("--latex-latency", type=float, default=1.0, help="Stub pdflatex run time in seconds")
+    parser.add_argument("--saturation-ratio", type=float, default=0.9,
+                        help="Achieved/offered throughput below which a rate counts as saturated")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the raw results to this file")
+    args = parser.parse_args(argv)
+
+    rates = [float(r) for r in args.rates.split(",") if r.strip()]
+    model = FakeGeminiModel(
+        latency=LatencyProfile(args.latency_dist, args.latency_median, args.latency_spread),
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        response_size=args.response_size,
+        seed=args.seed,
+    )
+
+    json_path = os.path.abspath(args.json_path) if args.json_path else None
+    with tempfile.TemporaryDirectory(prefix="resume_loadtest_") as workdir:
+        if args.latex == "stub":
+            install_stub_pdflatex(workdir, args.latex_latency)
+        # generate_resume writes output/ and PDFs relative to the working directory
+        previous_cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            request_fn = build_target(args.target, model, args.compile_workers)
+            levels = []
+            for rate in rates:
+                print(f"🚀 {rate:.2f} rps for {args.duration:.0f}s ({args.target}, {args.workers} workers)...")
+                levels.append(run_level(request_fn, model, rate, args.duration, args.workers))
+        finally:
+            os.chdir(previous_cwd)
+
+    print_report(levels, args.saturation_ratio)
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "levels": levels}, f, indent=2)
+        print(f"📝 Results written: {json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Output-token benchmark - full LLM parsing vs. local pre-parsing + prose-only rewrite
+
+Offline (default): builds the JSON each path asks Gemini to emit from the locally parsed
+sample resumes and estimates tokens at ~4 characters per token. The content is identical
+in both, so the difference is exactly the structure the model no longer reproduces.
+
+Live (--live, needs GEMINI_API_KEY): runs enhance_resume_with_ai with preparse off and on
+and reports Gemini's own usage_metadata token counts and wall time.
+
+Example:
+    python src/loadtest/preparse_benchmark.py
+    python src/loadtest/preparse_benchmark.py --live --repeat 3
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, Any, List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(ROOT_DIR, 'src'))
+
+from loadtest.harness import SAMPLE_INPUT, SAMPLE_JOB_DESCRIPTION
+from parsers.resume_parser import parse_resume_fields, is_complete
+from prompts.enhancement_prompts import ENHANCE_RESUME_PROMPT, REWRITE_CONTENT_PROMPT
+
+CHARS_PER_TOKEN = 4
+
+SENIOR_INPUT = {
+    "full_name": "Priya Raman", "email": "priya.raman@email.com", "phone": "+1-555-0199",
+    "location": "Seattle, WA", "linkedin": "linkedin.com/in/priyaraman", "portfolio": "priyaraman.dev",
+    "summary": "Staff engineer focused on distributed data platforms and developer productivity",
+    "experience": (
+        "Staff Software Engineer at CloudScale Inc.\n2021 - Present\n"
+        "- Led migration of batch pipelines to streaming, cutting data latency from hours to minutes\n"
+        "- Designed multi-region storage layer handling 2PB of data\n"
+        "- Mentored 6 engineers and ran the architecture review board\n\n"
+        "Senior Software Engineer at DataWorks\nJan 2017 - Dec 2020\n"
+        "- Built the internal feature store used by 40 ML teams\n"
+        "- Reduced cluster costs by 30% through autoscaling work\n\n"
+        "Software Engineer at Initech\n2014 - 2016\n"
+        "- Developed billing services in Java\n"
+        "- Introduced CI/CD, reducing release time from weeks to days"
+    ),
+    "education": (
+        "Master of Science in Computer Science\nUniversity of Washington\n2014\n\n"
+        "Bachelor of Technology in Computer Engineering\nNational Institute of Technology\n2012\nGPA: 3.9/4.0"
+    ),
+    "projects": (
+        "StreamLens - open-source Kafka lag visualizer\n2022 - 2023\nTech stack: Go, React, Kafka\n"
+        "Adopted by 300+ companies\n\n"
+        "FeatureKit\nPython library for offline/online feature parity\nTechnologies: Python, Redis, Spark"
+    ),
+    "skills": "Python, Go, Java, Kafka, Spark, Kubernetes, Terraform, AWS, GCP, React",
+    "certifications": (
+        "AWS Certified Solutions Architect - Professional\nAmazon Web Services\n2022\n"
+        "Certified Kubernetes Administrator\nCloud Native Computing Foundation\n2021"
+    ),
+}
+
+SAMPLES = {"software_engineer": SAMPLE_INPUT, "staff_engineer": SENIOR_INPUT}
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, round(len(text) / CHARS_PER_TOKEN))
+
+
+def _rewrite_payload(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """The index-keyed reply REWRITE_CONTENT_PROMPT asks for"""
+    return {
+        "summary": profile.get("summary", ""),
+        "skills": profile.get("skills", ""),
+        "experience": [{"index": i, "highlights": e.get("highlights", [])}
+                       for i, e in enumerate(profile.get("experience", []))],
+        "projects": [{"index": i, "description": p.get("description", [])}
+                     for i, p in enumerate(profile.get("projects", []))],
+    }
+
+
+def _rewrite_input(profile: Dict[str, Any]) -> Dict[str, Any]:
+    payload = _rewrite_payload(profile)
+    for entry, source in zip(payload["experience"], profile.get("experience", [])):
+        entry.update({"title": source.get("title", ""), "company": source.get("company", "")})
+    for entry, source in zip(payload["projects"], profile.get("projects", [])):
+        entry.update({"name": source.get("name", ""), "technologies": source.get("technologies", [])})
+    return payload
+
+
+def run_offline() -> List[Dict[str, Any]]:
+    from ai.resume_generator import AIResumeGenerator
+
+    formatter = AIResumeGenerator(offline=True)
+    rows = []
+    for name, raw_data in SAMPLES.items():
+        parsed = parse_resume_fields(raw_data)
+        full_output = json.dumps(parsed, indent=4)
+        rewrite_output = json.dumps(_rewrite_payload(parsed), indent=4)
+        full_prompt = ENHANCE_RESUME_PROMPT.format(
+            input_data=formatter._format_input_data(raw_data), job_description=SAMPLE_JOB_DESCRIPTION)
+        rewrite_prompt = REWRITE_CONTENT_PROMPT.format(
+            job_description=SAMPLE_JOB_DESCRIPTION, profile_data=json.dumps(_rewrite_input(parsed), indent=2))
+        rows.append({
+            "sample": name,
+            "fully_parsed": is_complete(raw_data, parsed),
+            "full_output_tokens": estimate_tokens(full_output),
+            "preparsed_output_tokens": estimate_tokens(rewrite_output),
+            "full_prompt_tokens": estimate_tokens(full_prompt),
+            "preparsed_prompt_tokens": estimate_tokens(rewrite_prompt),
+        })
+    return rows
+
+
+class UsageRecordingModel:
+    """Wraps a GenerativeModel and sums usage_metadata across calls"""
+
+    def __init__(self, model):
+        self.model = model
+        self._lock = threading.Lock()
+        self.prompt_tokens = 0
+        self.output_tokens = 0
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        response = self.model.generate_content(prompt)
+        usage = getattr(response, "usage_metadata", None)
+        with self._lock:
+            self.calls += 1
+            if usage is not None:
+                self.prompt_tokens += usage.prompt_token_count
+                self.output_tokens += usage.candidates_token_count
+        return response
+
+
+def run_live(repeat: int) -> List[Dict[str, Any]]:
+    import google.generativeai as genai
+    from ai.resume_generator import AIResumeGenerator
+
+    api_key = os.getenv('GEMINI_API_KEY')
+    if not api_key:
+        raise SystemExit("❌ GEMINI_API_KEY not found - run without --live for the offline estimate")
+    genai.configure(api_key=api_key)
+
+    rows = []
+    for name, raw_data in SAMPLES.items():
+        row = {"sample": name, "fully_parsed": is_complete(raw_data, parse_resume_fields(raw_data))}
+        for label, preparse in (("full", False), ("preparsed", True)):
+            model = UsageRecordingModel(genai.GenerativeModel('gemini-1.5-flash'))
+            generator = AIResumeGenerator(model=model, preparse=preparse)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                generator.enhance_resume_with_ai(dict(raw_data), SAMPLE_JOB_DESCRIPTION)
+            row[f"{label}_seconds"] = (time.perf_counter() - start) / repeat
+            row[f"{label}_output_tokens"] = model.output_tokens // repeat
+            row[f"{label}_prompt_tokens"] = model.prompt_tokens // repeat
+            row[f"{label}_calls"] = model.calls / repeat
+        rows.append(row)
+    return rows
+
+
+def print_report(rows: List[Dict[str, Any]], live: bool):
+    source = "Gemini usage_metadata" if live else f"estimated at ~{CHARS_PER_TOKEN} chars/token"
+    print(f"\n📉 Output tokens per resume, full parsing vs. pre-parsed ({source})")
+    header = f"{'sample':<20} {'parsed':>7} {'full out':>9} {'pre out':>8} {'saved':>7} {'full in':>8} {'pre in':>7}"
+    if live:
+        header += f" {'full s':>7} {'pre s':>6}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        saved = 1 - row["preparsed_output_tokens"] / row["full_output_tokens"] if row["full_output_tokens"] else 0.0
+        line = (f"{row['sample']:<20} {'yes' if row['fully_parsed'] else 'no':>7} "
+                f"{row['full_output_tokens']:>9} {row['preparsed_output_tokens']:>8} {saved:>7.0%} "
+                f"{row['full_prompt_tokens']:>8} {row['preparsed_prompt_tokens']:>7}")
+        if live:
+            line += f" {row['full_seconds']:>7.2f} {row['preparsed_seconds']:>6.2f}"
+        print(line)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Benchmark output tokens with and without local pre-parsing")
+    parser.add_argument("--live", action="store_true", help="Call Gemini and report real token usage")
+    parser.add_argument("--repeat", type=int, default=1, help="Live runs per sample and mode (averaged)")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the raw results to this file")
+    args = parser.parse_args(argv)
+
+    rows = run_live(args.repeat) if args.live else run_offline()
+    print_report(rows, args.live)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"live": args.live, "rows": rows}, f, indent=2)
+        print(f"📝 Results written: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Deterministic Resume Pre-Parser
+Line-oriented form input -> the structured schema the LaTeX/HTML formatters expect
+
+Handles the formats the Gradio form suggests, e.g.
+
+    Senior Software Engineer at TechCorp Inc.
+    2022 - Present
+    Led development of microservices architecture serving 1M+ users
+
+Entries are separated by blank lines (or, for experience, by a new "Title at Company"
+line followed by a date line). Anything the parser cannot place is left out of the
+entry (dates are left blank), so is_complete() can tell the caller to fall back to full
+LLM parsing.
+"""
+
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+_MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+_YEAR = r'(?:19|20)\d{2}'
+_DATE = rf'(?:{_MONTH}\s+{_YEAR}|\d{{1,2}}/{_YEAR}|{_YEAR}-\d{{2}}|{_YEAR})'
+_END_DATE = rf'(?:{_DATE}|present|current|now|ongoing)'
+
+DATE_RANGE_RE = re.compile(rf'\b({_DATE})\s*(?:-|–|—|to|until)\s*({_END_DATE})(?![\d/-])', re.IGNORECASE)
+SINGLE_DATE_RE = re.compile(rf'\b({_DATE})(?![\d/-])', re.IGNORECASE)
+BULLET_RE = re.compile(r'^\s*(?:[-*•▪‣◦]|\d+[.)])\s+')
+TITLE_AT_RE = re.compile(r'^(.+?)\s+(?:at|@)\s+(.+)$', re.IGNORECASE)
+HEADER_SPLIT_RE = re.compile(r'\s+(?:at|@)\s+|\s+[-–—|]\s+|,\s+', re.IGNORECASE)
+TECH_LABEL_RE = re.compile(r'^(?:technologies|tech stack|tech|stack|tools|built with)\s*:\s*(.+)$', re.IGNORECASE)
+ISSUER_SPLIT_RE = re.compile(r'\s+(?:by|from)\s+|\s*\|\s*|\s+[-–—]\s+|,\s+', re.IGNORECASE)
+EMPTY_BRACKETS_RE = re.compile(r'\(\s*\)')
+LIST_SPLIT_RE = re.compile(r'[,;|\n]')
+
+# Words match in any case; abbreviations only in their capitalised/dotted forms (BE, B.E., MA,
+# M.A., BSc...) so plain words like "be", "me" and "ma" in detail lines don't start a new degree
+DEGREE_KEYWORDS = re.compile(
+    r'(?<!\w)(?:(?i:bachelor\w*|master\w*|associate|doctor\w*|diploma|degree|certificate|ph\.?d\.?|mba)'
+    r'|B\.?Sc?\.?|M\.?Sc?\.?|B\.?A\.?|M\.?A\.?|B\.?Tech\.?|M\.?Tech\.?|B\.?E\.?|M\.?E\.?)(?!\w)')
+INSTITUTION_KEYWORDS = re.compile(r'\b(?:university|college|institute|school|academy|polytechnic)\b', re.IGNORECASE)
+EDUCATION_DETAIL_KEYWORDS = re.compile(r'\b(?:gpa|cgpa|honou?rs|cum laude|coursework|thesis|minor|dean)\b',
+                                       re.IGNORECASE)
+
+PRESENT_WORDS = {"present", "current", "now", "ongoing"}
+
+
+def _blocks(text: str) -> List[List[str]]:
+    """Split text into blank-line separated blocks of stripped, non-empty lines"""
+    blocks, current = [], []
+    for line in (text or "").splitlines():
+        if line.strip():
+            current.append(line.strip())
+        elif current:
+            blocks.append(current)
+            current = []
+    if current:
+        blocks.append(current)
+    return blocks
+
+
+def _strip_bullet(line: str) -> str:
+    return BULLET_RE.sub('', line).strip()
+
+
+def _unmatched_brackets(text: str) -> set:
+    """Indices of "(" / ")" without a partner"""
+    unmatched, opened = set(), []
+    for i, char in enumerate(text):
+        if char == "(":
+            opened.append(i)
+        elif char == ")":
+            if opened:
+                opened.pop()
+            else:
+                unmatched.add(i)
+    return unmatched | set(opened)
+
+
+def _split_outside_brackets(pattern: re.Pattern, text: str, maxsplit: int = 0) -> List[str]:
+    """pattern.split(text) ignoring separators inside (...) or [...], so "AWS (EC2, S3)" stays whole"""
+    depth, depths = 0, []
+    for char in text:
+        depths.append(depth)
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth = max(0, depth - 1)
+    parts, last = [], 0
+    for match in pattern.finditer(text):
+        if depths[match.start()] or match.end() == match.start():
+            continue
+        parts.append(text[last:match.start()])
+        last = match.end()
+        if maxsplit and len(parts) == maxsplit:
+            break
+    parts.append(text[last:])
+    return parts
+
+
+def _clean_part(text: str) -> str:
+    """Trim separators; a bracket at either end goes only when empty or unmatched, so
+    "Engineer (Contract)" survives but "Acme (" left by a removed date does not"""
+    text = EMPTY_BRACKETS_RE.sub('', text)
+    while True:
+        text = text.strip(" \t,;:|-–—")
+        unmatched = _unmatched_brackets(text)
+        if 0 in unmatched:
+            text = text[1:]
+        elif len(text) - 1 in unmatched:
+            text = text[:-1]
+        else:
+            return text
+
+
+def _normalize_date(value: str) -> str:
+    value = value.strip()
+    return "Present" if value.lower() in PRESENT_WORDS else value
+
+
+def find_date_range(line: str) -> Optional[Tuple[str, str, str]]:
+    """Return (start, end, line without the dates) for the first date range or lone date"""
+    match = DATE_RANGE_RE.search(line)
+    if match:
+        start, end = _normalize_date(match.group(1)), _normalize_date(match.group(2))
+    else:
+        match = SINGLE_DATE_RE.search(line)
+        if not match:
+            return None
+        start = end = _normalize_date(match.group(1))
+    rest = (line[:match.start()] + " " + line[match.end():]).strip()
+    return start, end, rest
+
+
+def _is_date_line(line: str) -> bool:
+    dates = find_date_range(line)
+    return dates is not None and not dates[2]
+
+
+def split_title_company(line: str) -> Tuple[str, str]:
+    """'Senior Engineer at TechCorp' / 'Engineer - TechCorp' / 'Engineer, TechCorp' -> (title, company)"""
+    match = TITLE_AT_RE.match(line)
+    if match:
+        return _clean_part(match.group(1)), _clean_part(match.group(2))
+    parts = [p for p in (_clean_part(p) for p in _split_outside_brackets(HEADER_SPLIT_RE, line, maxsplit=1)) if p]
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return _clean_part(line), ""
+
+
+def split_list(text: str) -> List[str]:
+    """Split a comma/semicolon/pipe/newline separated list, dropping blanks and duplicates"""
+    items, seen = [], set()
+    for item in _split_outside_brackets(LIST_SPLIT_RE, text or ""):
+        item = _clean_part(_strip_bullet(item))
+        if item and item.lower() not in seen:
+            seen.add(item.lower())
+            items.append(item)
+    return items
+
+
+def parse_experience(text: str) -> List[Dict[str, Any]]:
+    entries = []
+    for block in _blocks(text):
+        current = None
+        for i, raw_line in enumerate(block):
+            line = _strip_bullet(raw_line)
+            dates = find_date_range(line)
+            header = dates[2] if dates else line
+            next_is_date = i + 1 < len(block) and _is_date_line(_strip_bullet(block[i + 1]))
+
+            # A block's first line is always a header; later "Title at Company" lines start a
+            # new entry only when dated, so "Led work at scale" stays a bullet
+            starts_entry = current is None or (
+                not BULLET_RE.match(raw_line) and TITLE_AT_RE.match(header) is not None
+                and (next_is_date or bool(dates and dates[2]))
+            )
+
+            if starts_entry:
+                current = {"highlights": []}
+                entries.append(current)
+                if dates:
+                    # "Engineer at Google, 2022-2024, worked on search" -> header + trailing bullet
+                    match = DATE_RANGE_RE.search(line) or SINGLE_DATE_RE.search(line)
+                    header, trailing = _clean_part(line[:match.start()]), _clean_part(line[match.end():])
+                    current["date_start"], current["date_end"] = dates[0], dates[1]
+                    if trailing:
+                        current["highlights"].append(trailing)
+                title, company = split_title_company(header)
+                if title:
+                    current["title"] = title
+                if company:
+                    current["company"] = company
+            elif dates and not dates[2] and "date_start" not in current:
+                current["date_start"], current["date_end"] = dates[0], dates[1]
+            else:
+                current["highlights"].append(line)
+    for entry in entries:
+        entry.setdefault("date_start", "")
+        entry.setdefault("date_end", "")
+    return entries
+
+
+def parse_education(text: str) -> List[Dict[str, Any]]:
+    entries = []
+    for block in _blocks(text):
+        current = None
+        for raw_line in block:
+            line = _strip_bullet(raw_line)
+            if INSTITUTION_KEYWORDS.search(line) and DEGREE_KEYWORDS.search(line):
+                # "B.S. Computer Science, Stanford University, 2019" on one line
+                parts = [line]
+                dates = find_date_range(line)
+                if dates:
+                    parts = [dates[2]]
+                parts = [p for p in (_clean_part(p) for p in _split_outside_brackets(HEADER_SPLIT_RE, parts[0])) if p]
+                if dates:
+                    parts.append(dates[1])
+            else:
+                parts = [line]
+
+            for part in parts:
+                dates = find_date_range(part)
+                if current is None or ("degree" in current and DEGREE_KEYWORDS.search(part)
+                                       and not EDUCATION_DETAIL_KEYWORDS.search(part)
+                                       and not INSTITUTION_KEYWORDS.search(part)):
+                    current = {"details": []}
+                    entries.append(current)
+                if dates and not dates[2] and "date" not in current:
+                    current["date"] = dates[1]
+                elif EDUCATION_DETAIL_KEYWORDS.search(part):
+                    current["details"].append(part)
+                elif INSTITUTION_KEYWORDS.search(part) and "institution" not in current:
+                    current["institution"] = part
+                elif "degree" not in current:
+                    current["degree"] = part
+                elif "institution" not in current:
+                    current["institution"] = part
+                else:
+                    current["details"].append(part)
+    for entry in entries:
+        entry.setdefault("date", "")
+    return entries
+
+
+def parse_projects(text: str, known_skills: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    entries = []
+    for block in _blocks(text):
+        lines = [_strip_bullet(line) for line in block]
+        name = lines[0]
+        description, technologies = [], []
+
+        # "Project Name - short description" / "Project Name: short description"
+        split = re.split(r'\s+[-–—]\s+|:\s+', name, maxsplit=1)
+        if len(split) == 2 and len(split[0]) <= 60:
+            name, first_desc = _clean_part(split[0]), _clean_part(split[1])
+            if first_desc:
+                description.append(first_desc)
+
+        entry = {"name": name}
+        for line in lines[1:]:
+            tech_match = TECH_LABEL_RE.match(line)
+            dates = find_date_range(line)
+            if tech_match:
+                technologies.extend(split_list(tech_match.group(1)))
+            elif dates and not dates[2] and "date_start" not in entry:
+                entry["date_start"], entry["date_end"] = dates[0], dates[1]
+            else:
+                description.append(line)
+
+        if not technologies and known_skills:
+            block_text = " ".join(lines)
+            technologies = [skill for skill in known_skills
+                            if re.search(rf'(?<!\w){re.escape(skill)}(?!\w)', block_text, re.IGNORECASE)]
+
+        entry.setdefault("date_start", "")
+        entry.setdefault("date_end", "")
+        entry["technologies"] = technologies
+        entry["description"] = description
+        entries.append(entry)
+    return entries
+
+
+def parse_certifications(text: str) -> List[Dict[str, Any]]:
+    entries = []
+    for block in _blocks(text):
+        current: Dict[str, Any] = {}
+        for raw_line in block:
+            line = _strip_bullet(raw_line)
+            dates = find_date_range(line)
+            if dates and dates[2]:
+                # "AWS Solutions Architect - Amazon Web Services (2023)" on one line
+                if current:
+                    entries.append(current)
+                parts = [p for p in (_clean_part(p) for p in _split_outside_brackets(ISSUER_SPLIT_RE, dates[2])) if p]
+                current = {"name": " - ".join(parts[:-1]) if len(parts) > 1 else parts[0], "date": dates[1]}
+                if len(parts) > 1:
+                    current["issuer"] = parts[-1]
+                entries.append(current)
+                current = {}
+            elif dates:
+                current["date"] = dates[1]
+                entries.append(current)
+                current = {}
+            elif "name" not in current:
+                parts = [p for p in (_clean_part(p) for p in re.split(r'\s+(?:by|from)\s+|\s*\|\s*', line)) if p]
+                current["name"] = parts[0]
+                if len(parts) > 1:
+                    current["issuer"] = parts[-1]
+            elif "issuer" not in current:
+                current["issuer"] = line
+            else:
+                entries.append(current)
+                current = {"name": line}
+        if current:
+            entries.append(current)
+    for entry in entries:
+        entry.setdefault("date", "")
+    return entries
+
+
+def parse_skills(text: str) -> str:
+    """Keep categorised skills ("Languages: Python | Cloud: AWS") as written, normalise plain lists"""
+    if not text or not text.strip():
+        return ""
+    if ":" in text:
+        return " | ".join(_clean_part(line) for line in text.splitlines() if _clean_part(line))
+    return ", ".join(split_list(text))
+
+
+def parse_resume_fields(raw_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse the Gradio form fields into the enhanced-resume schema without calling the LLM"""
+    skills = raw_data.get("skills") or ""
+    known_skills = [s.split(":")[-1].strip() for s in split_list(skills) if s.split(":")[-1].strip()]
+
+    def field(name: str):
+        value = raw_data.get(name)
+        return value if isinstance(value, str) else ""
+
+    def structured(name: str, parser, *args):
+        value = raw_data.get(name)
+        if isinstance(value, list):
+            return value
+        return parser(field(name), *args)
+
+    return {
+        "full_name": field("full_name").strip(),
+        "email": field("email").strip(),
+        "phone": field("phone").strip(),
+        "location": field("location").strip(),
+        "linkedin": field("linkedin").strip(),
+        "portfolio": field("portfolio").strip(),
+        "summary": " ".join(field("summary").split()),
+        "experience": structured("experience", parse_experience),
+        "education": structured("education", parse_education),
+        "projects": structured("projects", parse_projects, known_skills),
+        "skills": parse_skills(skills) if isinstance(skills, str) else skills,
+        "certifications": structured("certifications", parse_certifications),
+    }
+
+
+def is_complete(raw_data: Dict[str, Any], parsed: Dict[str, Any]) -> bool:
+    """True when every non-empty free-text field produced fully identified, dated entries"""
+    # The rewrite prompt treats these as final, so a blank one would never be filled in
+    required = {
+        "experience": ("title", "company", "date_start"),
+        "education": ("degree", "institution", "date"),
+        "projects": ("name",),
+        "certifications": ("name", "issuer", "date"),
+    }
+    for field, keys in required.items():
+        raw = raw_data.get(field)
+        entries = parsed.get(field) or []
+        if isinstance(raw, str) and raw.strip() and not entries:
+            return False
+        for entry in entries:
+            if not isinstance(entry, dict) or any(not entry.get(key) for key in keys):
+                return False
+    return True
@@ -186,4 +186,112 @@ Return an optimized skills string that:
 4. Includes trending technologies when relevant
 
 Format: "Technical Skills: [skills] | Tools & Frameworks: [tools] | Soft Skills: [skills]"
-"""
\ No newline at end of file
+"""
+
+# PHASE 1 OF MULTI-TARGET MODE: JOB-AGNOSTIC PARSE + ENHANCEMENT (run once per candidate, cached)
+PARSE_PROFILE_PROMPT = """
+🎯 YOU ARE THE WORLD'S #1 RESUME OPTIMIZATION EXPERT 🎯
+
+MISSION: Convert natural language resume input into a canonical structured JSON profile.
+This profile will be reused for MANY different job applications, so do NOT target any single job.
+
+INPUT DATA (Natural Language):
+{input_data}
+
+🔥 PARSING INSTRUCTIONS:
+- EXPERIENCE: job titles, company names, date ranges; bullet points as quantified achievements
+- EDUCATION: degree, institution, graduation date, relevant details
+- PROJECTS: project names, technologies used, achievement bullets with technical depth and impact
+- CERTIFICATIONS: names, issuers, dates
+
+🚀 ENHANCEMENT RULES:
+- Add metrics to every bullet point (percentages, user counts, time savings; ranges if unknown)
+- Use strong action verbs matched to seniority
+- Keep wording broadly applicable - job-specific tailoring happens in a later step
+
+🏆 RETURN JSON WITH EXACTLY THIS STRUCTURE:
+
+{{
+    "full_name": "[Name]",
+    "email": "[Email]",
+    "phone": "[Phone in +1-XXX-XXX-XXXX format]",
+    "location": "[Location]",
+    "linkedin": "[LinkedIn URL]",
+    "portfolio": "[Portfolio URL]",
+    "summary": "[Enhanced 4-sentence summary]",
+    "experience": [
+        {{"title": "[Job Title]", "company": "[Company]", "date_start": "YYYY-MM", "date_end": "YYYY-MM or Present",
+          "highlights": ["[Quantified achievement]", "..."]}}
+    ],
+    "education": [
+        {{"degree": "[Degree]", "institution": "[University]", "date": "YYYY-MM", "details": ["..."]}}
+    ],
+    "projects": [
+        {{"name": "[Project Name]", "date_start": "YYYY-MM", "date_end": "YYYY-MM",
+          "technologies": ["[Tech]", "..."], "description": ["[Achievement]", "..."]}}
+    ],
+    "skills": "[Categorized skills: Programming Languages: [list] | Frameworks: [list] | Cloud/Tools: [list]]",
+    "certifications": [
+        {{"name": "[Certification]", "issuer": "[Issuer]", "date": "YYYY-MM"}}
+    ]
+}}
+
+CRITICAL: Return ONLY valid JSON.
+"""
+
+# PHASE 2 OF MULTI-TARGET MODE: LIGHTWEIGHT PER-JOB TAILORING OF AN ALREADY-PARSED PROFILE
+TAILOR_RESUME_PROMPT = """
+You are tailoring an already-structured resume to one job description.
+
+TARGET JOB DESCRIPTION:
+{job_description}
+
+CURRENT RESUME CONTENT (JSON):
+{profile_data}
+
+Rewrite ONLY:
+1. "summary" - 3-4 sentences using the job's keywords and language
+2. "skills" - same skills, reordered so the most job-relevant come first (keep the "Category: list | ..." format)
+3. Bullet emphasis - for each experience/project entry, reorder bullets by relevance and lightly rephrase
+   them to surface matching keywords. Keep every metric; do not invent new facts or entries.
+
+Do NOT return titles, companies, dates, education, certifications or contact details.
+
+Return ONLY valid JSON with this structure (use the same "index" values as the input):
+
+{{
+    "summary": "[Tailored summary]",
+    "skills": "[Reordered skills string]",
+    "experience": [{{"index": 0, "highlights": ["[Bullet]", "..."]}}],
+    "projects": [{{"index": 0, "description": ["[Bullet]", "..."]}}]
+}}
+"""
+
+# PRE-PARSED MODE: STRUCTURE ALREADY EXTRACTED LOCALLY, ONLY REWRITE THE PROSE
+REWRITE_CONTENT_PROMPT = """
+🎯 YOU ARE THE WORLD'S #1 RESUME OPTIMIZATION EXPERT 🎯
+
+The resume below has already been parsed into structure. Titles, companies, dates, education and
+certifications are final - do NOT return them. Rewrite only the prose.
+
+TARGET JOB DESCRIPTION:
+{job_description}
+
+CURRENT RESUME CONTENT (JSON):
+{profile_data}
+
+🚀 REWRITE RULES:
+- "summary": enhanced 4-sentence summary with job-relevant keywords and quantified achievements
+- "skills": same skills grouped as "Programming Languages: [list] | Frameworks: [list] | Cloud/Tools: [list]"
+- Bullets: 2-4 per entry; add metrics to EVERY bullet (percentages, user counts, time savings; ranges if unknown)
+- Use strong action verbs matched to seniority and integrate job description keywords naturally
+
+Return ONLY valid JSON with this structure (use the same "index" values as the input):
+
+{{
+    "summary": "[Enhanced summary]",
+    "skills": "[Categorized skills]",
+    "experience": [{{"index": 0, "highlights": ["[Quantified achievement]", "..."]}}],
+    "projects": [{{"index": 0, "description": ["[Technical achievement with impact]", "..."]}}]
+}}
+"""
@@ -0,0 +1,43 @@
+"""
+HTML Preview Templates
+Lightweight approximations of the LaTeX templates for instant in-browser previews
+"""
+
+# HTML approximation of MINIMAL_TECH_TEMPLATE (same colours, section order and layout)
+TECH_PREVIEW_TEMPLATE = """
+<div style="font-family: 'Latin Modern Roman', 'Computer Modern', Georgia, serif; max-width: 816px; margin: 0 auto; padding: 48px 67px; background: #ffffff; color: #404040; font-size: 13px; line-height: 1.35; box-shadow: 0 0 6px rgba(0, 0, 0, 0.15);">
+    <style>
+        .resume-preview-section {{ color: rgb(0, 102, 204); font-size: 16px; font-weight: bold; border-bottom: 1px solid rgb(0, 102, 204); margin: 16px 0 8px 0; padding-bottom: 2px; }}
+        .resume-preview-row {{ display: flex; justify-content: space-between; }}
+        .resume-preview-strong {{ font-weight: bold; color: rgb(64, 64, 64); }}
+        .resume-preview-muted {{ font-style: italic; color: rgb(128, 128, 128); font-size: 12px; }}
+        .resume-preview-bullet {{ font-size: 12px; margin: 2px 0; }}
+        .resume-preview-entry {{ margin-bottom: 6px; }}
+    </style>
+
+    <div style="text-align: center;">
+        <div style="font-size: 24px; font-weight: bold; color: rgb(64, 64, 64);">{full_name}</div>
+        <div class="resume-preview-muted" style="font-style: normal; margin-top: 8px;">
+            Email: {email} &nbsp;|&nbsp; Phone: {phone} &nbsp;|&nbsp; Location: {location}
+        </div>
+        <div class="resume-preview-muted" style="font-style: normal; margin-top: 4px;">
+            <a href="{linkedin_url}" style="color: rgb(0, 102, 204);">LinkedIn Profile</a> &nbsp;|&nbsp;
+            <a href="{portfolio_url}" style="color: rgb(0, 102, 204);">Portfolio</a>
+        </div>
+    </div>
+
+    <div class="resume-preview-section">Professional Summary</div>
+    <div>{summary}</div>
+
+    <div class="resume-preview-section">Technical Skills</div>
+    <div>{skills}</div>
+
+    {experience_section}
+
+    {education_section}
+
+    {projects_section}
+
+    {certifications_section}
+</div>
+"""
@@ -0,0 +1,130 @@
+"""
+Tests for the multi-target profile cache (src/ai/profile_cache.py)
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT_DIR, 'src'))
+
+from ai.profile_cache import ProfileCache
+
+
+class CountingCompute:
+    """compute() stand-in that counts calls and can be held open until released"""
+
+    def __init__(self, cacheable: bool = True, block: bool = False):
+        self.cacheable = cacheable
+        self.calls = 0
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            calls = self.calls
+        self.release.wait(timeout=5)
+        return {"summary": f"profile {calls}"}, self.cacheable
+
+
+def test_hit_returns_a_copy_without_recomputing():
+    cache = ProfileCache()
+    compute = CountingCompute()
+    first = cache.get_or_compute("k", compute)
+    first["summary"] = "mutated by caller"
+    assert cache.get_or_compute("k", compute) == {"summary": "profile 1"}
+    assert compute.calls == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ProfileCache(max_entries=2)
+    computes = {key: CountingCompute() for key in "abc"}
+    cache.get_or_compute("a", computes["a"])
+    cache.get_or_compute("b", computes["b"])
+    cache.get_or_compute("a", computes["a"])  # "b" is now least recently used
+    cache.get_or_compute("c", computes["c"])
+
+    cache.get_or_compute("a", computes["a"])
+    cache.get_or_compute("b", computes["b"])
+    assert computes["a"].calls == 1
+    assert computes["b"].calls == 2
+
+
+def test_expired_entries_are_recomputed():
+    cache = ProfileCache(ttl_seconds=0)
+    compute = CountingCompute()
+    cache.get_or_compute("k", compute)
+    cache.get_or_compute("k", compute)
+    assert compute.calls == 2
+
+
+def test_concurrent_misses_share_one_computation():
+    cache = ProfileCache()
+    compute = CountingCompute(block=True)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(cache.get_or_compute, "k", compute) for _ in range(8)]
+        time.sleep(0.1)
+        compute.release.set()
+        results = [f.result(timeout=5) for f in futures]
+    assert compute.calls == 1
+    assert all(result == {"summary": "profile 1"} for result in results)
+
+
+def test_fallback_results_are_not_cached():
+    cache = ProfileCache()
+    compute = CountingCompute(cacheable=False)
+    assert cache.get_or_compute("k", compute) == {"summary": "profile 1"}
+    assert cache.get_or_compute("k", compute) == {"summary": "profile 2"}
+    assert compute.calls == 2
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    cache = ProfileCache()
+    release = threading.Event()
+    calls = []
+
+    def failing():
+        calls.append(1)
+        release.wait(timeout=5)
+        raise RuntimeError("parse failed")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(cache.get_or_compute, "k", failing) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result(timeout=5)
+    assert cache.get_or_compute("k", CountingCompute()) == {"summary": "profile 1"}
+
+
+def test_disk_is_used_only_when_configured(tmp_path):
+    compute = CountingCompute()
+    ProfileCache().get_or_compute("k", compute)
+    ProfileCache(cache_dir=str(tmp_path)).get_or_compute("k", compute)
+    assert os.listdir(tmp_path) == ["k.json"]
+
+    # A fresh process-level cache reads the profile back from disk
+    assert ProfileCache(cache_dir=str(tmp_path)).get_or_compute("k", compute) == {"summary": "profile 2"}
+    assert compute.calls == 2
+
+
+def test_expired_disk_entries_are_deleted(tmp_path):
+    compute = CountingCompute()
+    ProfileCache(ttl_seconds=60, cache_dir=str(tmp_path)).get_or_compute("k", compute)
+    path = tmp_path / "k.json"
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+
+    ProfileCache(ttl_seconds=60).get_or_compute("k", compute)  # memory-only cache ignores the file
+    ProfileCache(ttl_seconds=60, cache_dir=str(tmp_path)).get_or_compute("k", compute)
+    assert compute.calls == 3
+    assert path.stat().st_mtime > stale
@@ -0,0 +1,153 @@
+"""
+Table-driven tests for the local resume parser (src/parsers/resume_parser.py)
+
+Each parser case gives a form field's text and the entries it should produce; only the
+keys listed are compared and the entry count must match. The is_complete cases mark the
+boundary between the prose-only rewrite and the full LLM parse.
+"""
+
+import os
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT_DIR, 'src'))
+
+from parsers.resume_parser import (
+    find_date_range, parse_experience, parse_education, parse_projects,
+    parse_certifications, parse_skills, parse_resume_fields, is_complete,
+)
+
+# (name, parser, input text, expected entries - only the listed keys are compared)
+PARSER_CASES: List[Tuple[str, Callable[[str], Any], str, Any]] = [
+    ("experience: 'Title at Company', year to Present", parse_experience,
+     "Software Engineer at Acme Corp\n2022 - Present\n- Built APIs\n- Cut latency 30%",
+     [{"title": "Software Engineer", "company": "Acme Corp", "date_start": "2022", "date_end": "Present",
+       "highlights": ["Built APIs", "Cut latency 30%"]}]),
+    ("experience: 'Title - Company', month-year en dash", parse_experience,
+     "Data Analyst - Initech\nJan 2019 – Dec 2021\n- Built dashboards",
+     [{"title": "Data Analyst", "company": "Initech", "date_start": "Jan 2019", "date_end": "Dec 2021",
+       "highlights": ["Built dashboards"]}]),
+    ("experience: mm/yyyy 'to' range", parse_experience,
+     "Intern at Hooli\n06/2018 to 08/2018\n- Wrote integration tests",
+     [{"title": "Intern", "company": "Hooli", "date_start": "06/2018", "date_end": "08/2018"}]),
+    ("experience: one-line header, dates and bullet", parse_experience,
+     "Backend Engineer at Globex, 2022-2024, Built billing service",
+     [{"title": "Backend Engineer", "company": "Globex", "date_start": "2022", "date_end": "2024",
+       "highlights": ["Built billing service"]}]),
+    ("experience: blank-line separated entries", parse_experience,
+     "Engineer at Acme\n2020 - 2022\n- Shipped v2\n\nDeveloper at Initech\n2018 - 2020\n- Fixed bugs",
+     [{"title": "Engineer", "company": "Acme"}, {"title": "Developer", "company": "Initech"}]),
+    ("experience: undated entry leaves dates blank", parse_experience,
+     "Engineer at Acme\n- Shipped v2",
+     [{"title": "Engineer", "company": "Acme", "date_start": "", "date_end": ""}]),
+    ("experience: brackets in title and company are kept", parse_experience,
+     "Software Engineer (Contract) at Google (Remote)\n2022 - 2023\n- Built search tooling",
+     [{"title": "Software Engineer (Contract)", "company": "Google (Remote)", "date_start": "2022"}]),
+    ("experience: bracketed one-line dates leave no stray bracket", parse_experience,
+     "Engineer at Acme (2020 - 2022)",
+     [{"title": "Engineer", "company": "Acme", "date_start": "2020", "date_end": "2022"}]),
+    ("education: degree / institution / year / GPA block", parse_education,
+     "Bachelor of Science in Computer Science\nStanford University\n2019\nGPA: 3.8/4.0",
+     [{"degree": "Bachelor of Science in Computer Science", "institution": "Stanford University",
+       "date": "2019", "details": ["GPA: 3.8/4.0"]}]),
+    ("education: one-line dotted abbreviation", parse_education,
+     "B.E. in Mechanical Engineering, Anna University, 2016",
+     [{"degree": "B.E. in Mechanical Engineering", "institution": "Anna University", "date": "2016"}]),
+    ("education: capitalised abbreviation", parse_education,
+     "BE Computer Engineering\nPune University\n2015",
+     [{"degree": "BE Computer Engineering", "institution": "Pune University", "date": "2015"}]),
+    ("education: lowercase full degree word", parse_education,
+     "bachelor of arts\nOxford University\n2010",
+     [{"degree": "bachelor of arts", "institution": "Oxford University", "date": "2010"}]),
+    ("education: 'be' in a detail line is not a degree", parse_education,
+     "BSc Physics\nMIT\n2019\nTeaching assistant to be honest",
+     [{"degree": "BSc Physics", "institution": "MIT", "date": "2019",
+       "details": ["Teaching assistant to be honest"]}]),
+    ("education: 'me' / 'ba' / 'ma' in a detail line are not degrees", parse_education,
+     "BSc Physics\nMIT\n2019\nHelped me with ba and ma tutoring",
+     [{"degree": "BSc Physics", "details": ["Helped me with ba and ma tutoring"]}]),
+    ("projects: name - description, date range, tech stack line", lambda text: parse_projects(text, []),
+     "StreamLens - Kafka lag visualizer\n2022 - 2023\nTech stack: Go, React\nAdopted by 300+ companies",
+     [{"name": "StreamLens", "date_start": "2022", "date_end": "2023", "technologies": ["Go", "React"],
+       "description": ["Kafka lag visualizer", "Adopted by 300+ companies"]}]),
+    ("projects: 'Technologies:' label, undated", lambda text: parse_projects(text, []),
+     "FeatureKit\nPython library for feature parity\nTechnologies: Python, Redis",
+     [{"name": "FeatureKit", "date_start": "", "technologies": ["Python", "Redis"],
+       "description": ["Python library for feature parity"]}]),
+    ("projects: brackets in tech stack entries are kept", lambda text: parse_projects(text, []),
+     "Dashboard\nTech stack: React (Vite), Go",
+     [{"name": "Dashboard", "technologies": ["React (Vite)", "Go"]}]),
+    ("projects: commas inside tech stack brackets do not split", lambda text: parse_projects(text, []),
+     "Dashboard\nTech stack: AWS (EC2, S3), Go",
+     [{"name": "Dashboard", "technologies": ["AWS (EC2, S3)", "Go"]}]),
+    ("certifications: name / issuer / year triple", parse_certifications,
+     "AWS Certified Solutions Architect\nAmazon Web Services\n2022",
+     [{"name": "AWS Certified Solutions Architect", "issuer": "Amazon Web Services", "date": "2022"}]),
+    ("certifications: one-line with comma year", parse_certifications,
+     "CKA - Cloud Native Computing Foundation, 2021",
+     [{"name": "CKA", "issuer": "Cloud Native Computing Foundation", "date": "2021"}]),
+    ("certifications: one-line with bracketed year", parse_certifications,
+     "CKA - Cloud Native Computing Foundation (2021)",
+     [{"name": "CKA", "issuer": "Cloud Native Computing Foundation", "date": "2021"}]),
+    ("certifications: bracketed level in a triple", parse_certifications,
+     "AWS Certified Developer (Associate)\nAmazon Web Services\n2023",
+     [{"name": "AWS Certified Developer (Associate)", "issuer": "Amazon Web Services", "date": "2023"}]),
+    ("certifications: bracketed level and year on one line", parse_certifications,
+     "AWS Certified Developer (Associate) - Amazon Web Services (2023)",
+     [{"name": "AWS Certified Developer (Associate)", "issuer": "Amazon Web Services", "date": "2023"}]),
+    ("skills: mixed separators", parse_skills, "Python, Go; Kafka", "Python, Go, Kafka"),
+    ("skills: commas inside brackets do not split", parse_skills,
+     "Python, Node.js (Express), AWS (EC2, S3), Go", "Python, Node.js (Express), AWS (EC2, S3), Go"),
+    ("certifications: comma inside the bracketed level", parse_certifications,
+     "AWS Certified Developer (Associate, 2nd edition) - Amazon Web Services, 2023",
+     [{"name": "AWS Certified Developer (Associate, 2nd edition)", "issuer": "Amazon Web Services",
+       "date": "2023"}]),
+    ("dates: year to Present", find_date_range, "2022 - Present", ("2022", "Present", "")),
+    ("dates: month-year en dash", find_date_range, "Jan 2019 – Dec 2021", ("Jan 2019", "Dec 2021", "")),
+    ("dates: mm/yyyy 'to'", find_date_range, "06/2018 to 08/2018", ("06/2018", "08/2018", "")),
+]
+
+COMPLETE_INPUT = {
+    "full_name": "Alex Kim",
+    "experience": "Engineer at Acme\n2020 - 2022\n- Shipped v2",
+    "education": "BSc Physics\nMIT\n2019",
+    "projects": "",
+    "skills": "Python, Go",
+    "certifications": "CKA\nCloud Native Computing Foundation\n2021",
+}
+
+# (name, raw form data, expected is_complete)
+COMPLETENESS_CASES: List[Tuple[str, Dict[str, Any], bool]] = [
+    ("fully dated input", COMPLETE_INPUT, True),
+    ("empty free-text fields", {"full_name": "Alex Kim"}, True),
+    ("'be' / 'me' detail lines stay in one entry", dict(
+        COMPLETE_INPUT, education="BSc Physics\nMIT\n2019\nTeaching assistant to be honest\nHelped me a lot"), True),
+    ("no dates anywhere", dict(
+        COMPLETE_INPUT, experience="Engineer at Acme\n- Shipped v2", education="BSc Physics\nMIT",
+        certifications="CKA\nCloud Native Computing Foundation"), False),
+    ("undated experience", dict(COMPLETE_INPUT, experience="Engineer at Acme\n- Shipped v2"), False),
+    ("undated education", dict(COMPLETE_INPUT, education="BSc Physics\nMIT"), False),
+    ("undated certification", dict(COMPLETE_INPUT, certifications="CKA\nCloud Native Computing Foundation"), False),
+    ("experience without a title/company header", dict(COMPLETE_INPUT, experience="Did some contracting work"), False),
+]
+
+
+@pytest.mark.parametrize("parser, text, expected", [case[1:] for case in PARSER_CASES],
+                         ids=[case[0] for case in PARSER_CASES])
+def test_parser(parser, text, expected):
+    actual = parser(text)
+    if isinstance(expected, list) and expected and isinstance(expected[0], dict):
+        assert isinstance(actual, list) and len(actual) == len(expected), actual
+        for entry, wanted in zip(actual, expected):
+            assert {key: entry.get(key) for key in wanted} == wanted
+    else:
+        assert actual == expected
+
+
+@pytest.mark.parametrize("raw_data, expected", [case[1:] for case in COMPLETENESS_CASES],
+                         ids=[case[0] for case in COMPLETENESS_CASES])
+def test_is_complete(raw_data, expected):
+    assert is_complete(raw_data, parse_resume_fields(raw_data)) is expected